@@ -0,0 +1,18 @@
+const { isSettled } = require('../services/startupState')
+
+/**
+ * Reject requests with 503 + Retry-After while a startup component is still
+ * warming up in the background.
+ */
+module.exports = function requireStartup (component, retryAfterSeconds = 5) {
+  return function (req, res, next) {
+    if (isSettled(component)) {
+      return next()
+    }
+    res.set('Retry-After', String(retryAfterSeconds))
+    return res.status(503).json({
+      message: `Service warming up: ${component} not ready`,
+      retry_after: retryAfterSeconds
+    })
+  }
+}
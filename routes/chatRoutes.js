@@ -26,6 +26,7 @@ const {
   searchRagChunkReferences
 } = require('../services/dbUtils');
 const authenticate = require('../middleware/auth');
+const requireStartup = require('../middleware/requireStartup');
 const promptManager = require('../prompts');
 const { createLogger } = require('../services/logger');
 const { addAgentJob, getJobStatus, getQueueStats, registerStreamCallback, abortJob } = require('../services/queueService');
@@ -223,7 +224,7 @@ router.post('/copilot', authenticate, async (req, res) => {
 });
 
 // ========== AGENT COPILOT ROUTE (QUEUED WITH STREAMING) ==========
-router.post('/copilot-agent', authenticate, async (req, res) => {
+router.post('/copilot-agent', authenticate, requireStartup('mcp_tools'), async (req, res) => {
     const logger = createLogger('AgentRoute', req.body.session_id);
 
     try {
@@ -482,7 +483,7 @@ router.post('/copilot-agent', authenticate, async (req, res) => {
     }
 });
 
-router.post('/mcp/replay-tool-call', authenticate, async (req, res) => {
+router.post('/mcp/replay-tool-call', authenticate, requireStartup('mcp_tools'), async (req, res) => {
     const logger = createLogger('McpReplayRoute', req.body && req.body.session_id);
     try {
         const authHeader = req.headers.authorization || '';
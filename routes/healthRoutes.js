@@ -2,6 +2,7 @@
 
 const express = require('express');
 const { checkConnectionHealth, getPoolStats } = require('../services/database');
+const { isWarm, getStartupState } = require('../services/startupState');
 const router = express.Router();
 
 /**
@@ -23,10 +24,12 @@ router.get('/live', (req, res) => {
 router.get('/ready', async (req, res) => {
     const checks = {
         mongodb: null,
+        startup: getStartupState(),
         timestamp: new Date().toISOString()
     };
     
-    let isReady = true;
+    // Not ready while background warm-up (MongoDB, MCP tools) is still running
+    let isReady = isWarm();
     
     // Check MongoDB connection and pool
     try {
@@ -59,16 +62,30 @@ router.get('/ready', async (req, res) => {
     const statusCode = isReady ? 200 : 503;
     res.status(statusCode).json({
         status: isReady ? 'ready' : 'not_ready',
-        message: isReady ? 'Service ready (MongoDB connection pool active)' : 'Service not ready (MongoDB connection issues)',
+        message: isReady
+            ? 'Service ready (MongoDB connection pool active)'
+            : (isWarm() ? 'Service not ready (MongoDB connection issues)' : 'Service not ready (warming up)'),
         checks
     });
 });
 
 /**
  * Startup probe - has initialization completed?
- * Checks if MongoDB connection pool is established
+ * Reports 'warming' while background warm-up is still running, then
+ * checks if MongoDB connection pool is established
  */
 router.get('/startup', async (req, res) => {
+    if (!isWarm()) {
+        res.set('Retry-After', '5');
+        res.status(503).json({
+            status: 'warming',
+            message: 'Startup components are still warming up',
+            components: getStartupState(),
+            timestamp: new Date().toISOString()
+        });
+        return;
+    }
+
     const mongoHealth = await checkConnectionHealth();
     const poolStats = getPoolStats();
     
@@ -80,6 +97,7 @@ router.get('/startup', async (req, res) => {
                 connected: true,
                 poolSize: poolStats.poolConfig.maxPoolSize
             },
+            components: getStartupState(),
             timestamp: new Date().toISOString()
         });
     } else {
@@ -90,6 +108,7 @@ router.get('/startup', async (req, res) => {
                 connected: poolStats.isConnected,
                 error: poolStats.errorMessage
             },
+            components: getStartupState(),
             timestamp: new Date().toISOString()
         });
     }
@@ -31,7 +31,7 @@ const fs = require('fs');
 // === New helper modules (refactor) ===
 const { safeParseJson } = require('./jsonUtils');
 const { prepareCopilotContext } = require('./contextBuilder');
-const { sendSseError, startKeepAlive, stopKeepAlive } = require('./sseUtils');
+const { sendSseError, createTokenWriter, startKeepAlive, stopKeepAlive } = require('./sseUtils');
 const { setupCopilotStream } = require('./streamingHandlers');
 const promptManager = require('../prompts');
 const { buildConversationContext } = require('./memory/conversationContextService');
@@ -763,6 +763,8 @@ async function runModelStream(ctx, modelData, onChunk) {
  * SSE-enabled version of handleCopilotRequest. Writes chunks directly to `res`.
  */
 async function handleCopilotStreamRequest(opts, res) {
+  // Created up front so the error path can flush queued tokens too
+  const tokenWriter = createTokenWriter(res);
   try {
     const {
       save_chat = true,
@@ -792,14 +794,13 @@ async function handleCopilotStreamRequest(opts, res) {
     let assistantBuffer = '';
     const onChunk = (text) => {
       assistantBuffer += text;
-      const safeText = text.replace(/\n/g, '\\n');
-      res.write(`data: ${safeText}\n\n`);
-      if (typeof res.flush === 'function') res.flush();
+      tokenWriter.write(text);
     };
 
     await runModelStream(ctx, modelData, onChunk);
 
     // Stream completed
+    tokenWriter.flush();
     res.write('data: [DONE]\n\n');
     if (typeof res.flush === 'function') res.flush();
     res.end();
@@ -817,6 +818,7 @@ async function handleCopilotStreamRequest(opts, res) {
     }
   } catch (error) {
     console.error('Streaming copilot error:', error);
+    tokenWriter.flush();
     sendSseError(res, 'Internal server error');
   }
 }
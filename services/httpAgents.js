@@ -0,0 +1,20 @@
+// services/httpAgents.js
+
+const http = require('http');
+const https = require('https');
+
+/**
+ * Create a keep-alive http/https agent pair whose idle pooled sockets are
+ * closed after idleTimeoutMs. Keeping this below the upstream's keep-alive
+ * timeout narrows (but cannot close) the race where a request is written
+ * to a socket the server is closing.
+ */
+function createKeepAliveAgents(idleTimeoutMs, options = {}) {
+  const agentOptions = { keepAlive: true, timeout: idleTimeoutMs, ...options };
+  return {
+    httpAgent: new http.Agent(agentOptions),
+    httpsAgent: new https.Agent(agentOptions)
+  };
+}
+
+module.exports = { createKeepAliveAgents };
@@ -3,6 +3,8 @@
 const { OpenAI } = require('openai');
 const fetch = require('node-fetch');
 const config = require('../config.json');
+const { createLineSplitter } = require('./sseUtils');
+const { createKeepAliveAgents } = require('./httpAgents');
 
 // ========================================
 // Error Handling
@@ -20,6 +22,17 @@ class LLMServiceError extends Error {
 // Utility Functions
 // ========================================
 
+// The local utilities server (gunicorn, 2s keep-alive) gets a short idle
+// timeout; remote LLM hosts keep Node's default 5s so reuse isn't cut short
+const LOCAL_HOSTS = new Set(['0.0.0.0', 'localhost', '127.0.0.1']);
+const localAgents = createKeepAliveAgents(1500);
+const remoteAgents = createKeepAliveAgents(5000);
+
+function keepAliveAgent(parsedURL) {
+    const agents = LOCAL_HOSTS.has(parsedURL.hostname) ? localAgents : remoteAgents;
+    return parsedURL.protocol === 'http:' ? agents.httpAgent : agents.httpsAgent;
+}
+
 async function postJson(url, data, apiKey = null) {
     try {
         if (!url || !data) {
@@ -31,7 +44,8 @@ async function postJson(url, data, apiKey = null) {
         const res = await fetch(url, {
             method: 'POST',
             headers,
-            body: JSON.stringify(data)
+            body: JSON.stringify(data),
+            agent: keepAliveAgent
         });
         if (!res.ok) {
             let responseText = '';
@@ -413,13 +427,20 @@ async function postJsonStream(url, data, onChunk, apiKey = null) {
             throw new LLMServiceError('Missing required parameters for postJsonStream');
         }
 
-        const headers = { 'Content-Type': 'application/json' };
+        // Token streams are mostly ASCII text and compress well; node-fetch
+        // decodes gzip/deflate/br bodies transparently while streaming
+        const headers = {
+            'Content-Type': 'application/json',
+            'Accept-Encoding': 'gzip, deflate, br'
+        };
         if (apiKey) headers['Authorization'] = `Bearer ${apiKey}`;
 
         const res = await fetch(url, {
             method: 'POST',
             headers,
-            body: JSON.stringify(data)
+            body: JSON.stringify(data),
+            compress: true,
+            agent: keepAliveAgent
         });
 
         if (!res.ok) {
@@ -427,7 +448,11 @@ async function postJsonStream(url, data, onChunk, apiKey = null) {
         }
 
         return new Promise((resolve, reject) => {
-            let buffer = '';
+            // Comment/event-type lines are only framing for real SSE bodies;
+            // plain-text upstreams keep every line as answer text
+            const contentType = res.headers.get('content-type') || '';
+            const isEventStream = contentType.includes('text/event-stream');
+            const splitter = createLineSplitter({ skipIgnorable: isEventStream });
 
             const processPart = (rawPart) => {
                 let part = (rawPart || '').trim();
@@ -443,18 +468,22 @@ async function postJsonStream(url, data, onChunk, apiKey = null) {
                     return;
                 }
 
-                // Try to parse JSON – fallback to raw text if parsing fails
-                let textChunk = '';
-                try {
-                    const parsed = JSON.parse(part);
-                    // Attempt to extract assistant text from common response formats
-                    textChunk =
-                        parsed.choices?.[0]?.delta?.content ||
-                        parsed.choices?.[0]?.message?.content ||
-                        parsed.response ||
-                        '';
-                } catch (_) {
-                    textChunk = part; // raw text
+                // Only payloads that look like JSON are parsed – plain text tokens
+                // skip the parse attempt; malformed JSON still falls back to raw text
+                let textChunk = part;
+                const first = part.charCodeAt(0);
+                if (first === 123 /* { */ || first === 91 /* [ */) {
+                    try {
+                        const parsed = JSON.parse(part);
+                        // Attempt to extract assistant text from common response formats
+                        textChunk =
+                            parsed.choices?.[0]?.delta?.content ||
+                            parsed.choices?.[0]?.message?.content ||
+                            parsed.response ||
+                            '';
+                    } catch (_) {
+                        textChunk = part; // raw text
+                    }
                 }
 
                 if (textChunk) {
@@ -464,12 +493,8 @@ async function postJsonStream(url, data, onChunk, apiKey = null) {
 
             // node-fetch returns a Node.js Readable stream
             res.body.on('data', (chunk) => {
-                buffer += chunk.toString();
-
-                // Split on newlines – each SSE event is separated by a blank line
-                const parts = buffer.split(/\n/);
-                // Keep the last partial line in the buffer
-                buffer = parts.pop();
+                // Only complete lines come back; the partial tail stays in the splitter
+                const parts = splitter.push(chunk);
 
                 for (const part of parts) {
                     try {
@@ -485,6 +510,7 @@ async function postJsonStream(url, data, onChunk, apiKey = null) {
 
             res.body.on('end', () => {
                 // Process any trailing buffered content (e.g., single JSON response with no newline).
+                const buffer = splitter.flush();
                 if (buffer && buffer.trim()) {
                     try {
                         processPart(buffer);
@@ -1,6 +1,6 @@
 // services/mcp/mcpExecutor.js
 
-const axios = require('axios');
+const { mcpHttp } = require('./mcpHttpClient');
 const fs = require('fs');
 const path = require('path');
 const { getToolDefinition, loadToolsManifest } = require('./toolDiscovery');
@@ -863,7 +863,7 @@ async function paginateQueryCollection(toolId, originalParameters, firstResponse
       const timeout = config.global_settings?.tool_execution_timeout || 120000;
 
       // Execute pagination request (non-streaming for pagination)
-      const response = await axios.post(mcpEndpoint, jsonRpcRequest, {
+      const response = await mcpHttp.post(mcpEndpoint, jsonRpcRequest, {
         timeout,
         headers,
         withCredentials: true
@@ -0,0 +1,13 @@
+// services/mcp/mcpHttpClient.js
+
+const axios = require('axios');
+const { createKeepAliveAgents } = require('../httpAgents');
+
+/**
+ * Shared axios instance for all MCP server traffic (session init, tool
+ * discovery, tool calls). Idle sockets close after 4s; maxSockets is
+ * unbounded.
+ */
+const mcpHttp = axios.create(createKeepAliveAgents(4000, { maxFreeSockets: 16 }));
+
+module.exports = { mcpHttp };
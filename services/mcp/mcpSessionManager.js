@@ -1,6 +1,6 @@
 // services/mcp/mcpSessionManager.js
 
-const axios = require('axios');
+const { mcpHttp } = require('./mcpHttpClient');
 const config = require('./config.json');
 
 /**
@@ -63,7 +63,7 @@ class McpSessionManager {
     };
     
     try {
-      const response = await axios.post(mcpEndpoint, initRequest, {
+      const response = await mcpHttp.post(mcpEndpoint, initRequest, {
         timeout: serverConfig.timeout || 10000,
         headers,
         withCredentials: true
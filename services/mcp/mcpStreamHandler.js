@@ -1,8 +1,13 @@
 // services/mcp/mcpStreamHandler.js
 
-const axios = require('axios');
+const { mcpHttp } = require('./mcpHttpClient');
 const { createLogger } = require('../logger');
-const { emitSSE } = require('../sseUtils');
+const { emitSSE, createLineSplitter } = require('../sseUtils');
+const config = require('./config.json');
+
+// Per-batch console dumps re-serialize every batch just to print a preview;
+// only produce them when explicitly enabled
+const VERBOSE_STREAM_LOGGING = config.global_settings?.verbose_stream_logging === true;
 
 function createCancellationError(checkpoint = 'unknown') {
   const error = new Error(`Job cancelled by user (${checkpoint})`);
@@ -89,7 +94,7 @@ class McpStreamHandler {
     const stopCancellationWatcher = startCancellationWatcher(context, abortController);
     throwIfCancelled(context, 'before_non_streaming_request');
     try {
-      const response = await axios.post(mcpEndpoint, jsonRpcRequest, {
+      const response = await mcpHttp.post(mcpEndpoint, jsonRpcRequest, {
         timeout,
         headers,
         withCredentials: true,
@@ -123,7 +128,7 @@ class McpStreamHandler {
 
     try {
       // Use streaming response type
-      const response = await axios.post(mcpEndpoint, jsonRpcRequest, {
+      const response = await mcpHttp.post(mcpEndpoint, jsonRpcRequest, {
         timeout: timeout * 10, // Increase timeout for streaming (10x)
         headers,
         withCredentials: true,
@@ -157,7 +162,7 @@ class McpStreamHandler {
   async accumulateBatches(stream, context, toolId, log) {
     return new Promise((resolve, reject) => {
       const batches = [];
-      let buffer = '';
+      const splitter = createLineSplitter({ skipIgnorable: true });
       let batchCount = 0;
       let totalSize = 0;
       let lastBatch = null;
@@ -170,12 +175,10 @@ class McpStreamHandler {
           throwIfCancelled(context, 'stream_chunk_received');
 
           chunkCount++;
-          const chunkStr = chunk.toString();
-          buffer += chunkStr;
 
-          // Split on newlines - each SSE event is separated
-          const lines = buffer.split('\n');
-          buffer = lines.pop() || ''; // Keep incomplete line in buffer
+          // Split on newlines - each SSE event is separated.
+          // Incomplete trailing line is kept inside the splitter.
+          const lines = splitter.push(chunk);
 
           for (const line of lines) {
             throwIfCancelled(context, 'stream_line_processed');
@@ -277,7 +280,7 @@ class McpStreamHandler {
                   keys: Object.keys(parsed || {}),
                   hasJsonrpc: parsed?.jsonrpc,
                   hasResult: parsed?.result !== undefined,
-                  dataPreview: JSON.stringify(parsed).substring(0, 200)
+                  dataPreview: data.substring(0, 200)
                 });
                 continue;
               }
@@ -330,17 +333,19 @@ class McpStreamHandler {
               batchCount++;
               lastBatch = batch;
 
-              console.log(`[MCP Stream] Received batch ${batchCount}:`, {
-                batchNumber: batch.batchNumber,
-                count: batch.count,
-                cumulativeCount: batch.cumulativeCount,
-                done: batch.done,
-                hasResults: !!batch.results,
-                resultsLength: batch.results?.length || 0,
-                totalBatchesSoFar: batchCount,
-                batchKeys: Object.keys(batch),
-                rawBatch: JSON.stringify(batch).substring(0, 200) // First 200 chars for debugging
-              });
+              if (VERBOSE_STREAM_LOGGING) {
+                console.log(`[MCP Stream] Received batch ${batchCount}:`, {
+                  batchNumber: batch.batchNumber,
+                  count: batch.count,
+                  cumulativeCount: batch.cumulativeCount,
+                  done: batch.done,
+                  hasResults: !!batch.results,
+                  resultsLength: batch.results?.length || 0,
+                  totalBatchesSoFar: batchCount,
+                  batchKeys: Object.keys(batch),
+                  rawBatch: JSON.stringify(batch).substring(0, 200) // First 200 chars for debugging
+                });
+              }
 
               log.debug(`Received batch ${batchCount}`, {
                 batchNumber: batch.batchNumber,
@@ -348,9 +353,10 @@ class McpStreamHandler {
                 cumulativeCount: batch.cumulativeCount
               });
 
-              // Update size estimate
+              // Update size estimate from the payload as received rather than
+              // re-serializing the parsed results
               if (batch.results) {
-                totalSize += Buffer.byteLength(JSON.stringify(batch.results));
+                totalSize += Buffer.byteLength(data);
               }
 
               // Check if done
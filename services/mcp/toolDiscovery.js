@@ -2,7 +2,7 @@
 
 const fs = require('fs').promises;
 const path = require('path');
-const axios = require('axios');
+const { mcpHttp } = require('./mcpHttpClient');
 const { sessionManager } = require('./mcpSessionManager');
 
 const ROOT_CONFIG_PATH = path.join(__dirname, '../../config.json');
@@ -10,6 +10,11 @@ const MCP_CONFIG_PATH = path.join(__dirname, 'config.json');
 const TOOLS_MANIFEST_PATH = path.join(__dirname, 'tools.json');
 const TOOLS_PROMPT_PATH = path.join(__dirname, 'tools-for-prompt.txt');
 
+// In-memory copies of the files above. They only change when discovery
+// runs, so per-request lookups don't re-read them from disk.
+let cachedManifestText = null;
+let cachedToolsPrompt = null;
+
 /**
  * Discover tools from all configured MCP servers
  * Called on API startup
@@ -106,10 +111,9 @@ async function discoverTools() {
     });
     
     // Write manifest file (machine-readable)
-    await fs.writeFile(
-      TOOLS_MANIFEST_PATH,
-      JSON.stringify(toolsManifest, null, 2)
-    );
+    const manifestText = JSON.stringify(toolsManifest, null, 2);
+    await fs.writeFile(TOOLS_MANIFEST_PATH, manifestText);
+    cachedManifestText = manifestText;
     
     // Write prompt-optimized file (human/LLM-readable) with local tools appended
     await writeToolsForPrompt(toolsManifest);
@@ -174,7 +178,7 @@ async function fetchServerTools(serverKey, serverConfig, globalSettings, authTok
         params: {}
       };
       
-      const response = await axios.post(mcpEndpoint, toolsRequest, {
+      const response = await mcpHttp.post(mcpEndpoint, toolsRequest, {
         timeout: serverConfig.timeout || 10000,
         headers,
         withCredentials: true
@@ -280,15 +284,22 @@ async function writeToolsForPrompt(manifest) {
   });
   
   await fs.writeFile(TOOLS_PROMPT_PATH, promptText);
+  cachedToolsPrompt = promptText;
 }
 
 /**
  * Load cached tools manifest
+ * Parsed fresh on each call so callers can't mutate the shared copy
  */
 async function loadToolsManifest() {
   try {
-    const manifestFile = await fs.readFile(TOOLS_MANIFEST_PATH, 'utf8');
-    return JSON.parse(manifestFile);
+    if (cachedManifestText === null) {
+      // Only fill an empty cache: discovery may have set a fresher value
+      // while this read was in flight
+      const text = await fs.readFile(TOOLS_MANIFEST_PATH, 'utf8');
+      if (cachedManifestText === null) cachedManifestText = text;
+    }
+    return JSON.parse(cachedManifestText);
   } catch (error) {
     console.warn('[MCP] Tools manifest not found, run discovery first');
     return null;
@@ -300,7 +311,11 @@ async function loadToolsManifest() {
  */
 async function loadToolsForPrompt() {
   try {
-    return await fs.readFile(TOOLS_PROMPT_PATH, 'utf8');
+    if (cachedToolsPrompt === null) {
+      const text = await fs.readFile(TOOLS_PROMPT_PATH, 'utf8');
+      if (cachedToolsPrompt === null) cachedToolsPrompt = text;
+    }
+    return cachedToolsPrompt;
   } catch (error) {
     console.warn('[MCP] Tools prompt file not found');
     return '';
@@ -158,6 +158,10 @@ if (config.queue.enabled !== false) {
 
         // Create response stream wrapper for agent if streaming
         const responseStream = streamCallback ? {
+            // Structured events from emitSSE are forwarded without re-parsing
+            emitEvent: (eventType, data) => {
+                safeStreamEmit(jobId, eventType, data);
+            },
             write: (data) => {
                 // Agent writes SSE format, parse and re-emit
                 if (typeof data === 'string' && data.startsWith('event:')) {
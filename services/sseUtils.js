@@ -6,14 +6,13 @@
  */
 function writeSseEvent(res, eventType, data) {
   try {
-    if (eventType) {
-      res.write(`event: ${eventType}\n`);
-    }
+    // Build the whole frame first so each event is a single write
+    let frame = eventType ? `event: ${eventType}\n` : '';
     if (data) {
       const dataStr = typeof data === 'string' ? data : JSON.stringify(data);
-      res.write(`data: ${dataStr}\n`);
+      frame += `data: ${dataStr}\n`;
     }
-    res.write('\n');
+    res.write(frame + '\n');
     
     // Explicitly flush to prevent buffering (critical for pm2)
     if (typeof res.flush === 'function') {
@@ -36,6 +35,54 @@ function sendSseError(res, errorMsg) {
   }
 }
 
+/**
+ * Coalesce per-token "data:" frames into one write per interval.
+ * LLM streams emit many tiny tokens; writing and flushing each one costs a
+ * socket write apiece. A token arriving after an idle interval (e.g. the
+ * first one) is written immediately; tokens arriving faster are queued and
+ * written together at most every intervalMs. Call flush() before writing
+ * the terminating event.
+ */
+function createTokenWriter(res, intervalMs = 16) {
+  let frames = [];
+  let timer = null;
+  let lastWrite = 0;
+
+  const flush = () => {
+    if (timer) {
+      clearTimeout(timer);
+      timer = null;
+    }
+    if (frames.length === 0 || res.writableEnded) {
+      frames = [];
+      return;
+    }
+    const payload = frames.join('');
+    frames = [];
+    lastWrite = Date.now();
+    try {
+      res.write(payload);
+      if (typeof res.flush === 'function') res.flush();
+    } catch (_) {
+      /* connection might already be closed */
+    }
+  };
+
+  return {
+    write(text) {
+      frames.push(`data: ${escapeSseNewlines(text)}\n\n`);
+      if (timer) return;
+      const wait = intervalMs - (Date.now() - lastWrite);
+      if (wait <= 0) {
+        flush();
+      } else {
+        timer = setTimeout(flush, wait);
+      }
+    },
+    flush
+  };
+}
+
 /**
  * Start a periodic keep-alive comment (": keep-alive") on an SSE response.
  * Returns the interval ID so the caller can clear it later.
@@ -55,6 +102,91 @@ function stopKeepAlive(intervalId) {
   clearInterval(intervalId);
 }
 
+/**
+ * Escape newlines in a text token so it fits on a single "data:" line.
+ * Tokens without a newline (the common case) are returned untouched.
+ */
+function escapeSseNewlines(text) {
+  return text.indexOf('\n') === -1 ? text : text.replace(/\n/g, '\\n');
+}
+
+// SSE framing matched on raw bytes so ignorable lines are never decoded
+const SSE_COMMENT = 0x3a; // ':'
+const SSE_EVENT_FIELD = Buffer.from('event:');
+
+/**
+ * Length of a raw line without the "\r" of a CRLF terminator.
+ */
+function lineLength(buf) {
+  return buf.length > 0 && buf[buf.length - 1] === 13 ? buf.length - 1 : buf.length;
+}
+
+/**
+ * Whether a raw line carries no payload: blank lines, comments
+ * (keep-alive pings) and "event:" type lines.
+ */
+function isIgnorableLine(buf, length) {
+  if (length === 0 || buf[0] === SSE_COMMENT) return true;
+  return length >= SSE_EVENT_FIELD.length &&
+    SSE_EVENT_FIELD.compare(buf, 0, SSE_EVENT_FIELD.length) === 0;
+}
+
+/**
+ * Create an incremental line splitter for consuming an SSE response body.
+ * push(chunk) returns the complete lines received so far (without the
+ * trailing "\r"), flush() returns the leftover partial line once the
+ * stream has ended (or '' if there is none).
+ *
+ * Unterminated chunks are kept as a list and only concatenated when a
+ * line actually spans chunk boundaries, so large events delivered over
+ * many chunks are not re-copied on every push.
+ *
+ * With skipIgnorable, blank, comment and "event:" lines are dropped on
+ * the raw bytes before any UTF-8 decoding happens.
+ */
+function createLineSplitter({ skipIgnorable = false } = {}) {
+  let pending = [];
+
+  const decode = (buf, lines) => {
+    const length = lineLength(buf);
+    if (skipIgnorable && isIgnorableLine(buf, length)) return;
+    lines.push(buf.toString('utf8', 0, length));
+  };
+
+  return {
+    push(chunk) {
+      const buf = typeof chunk === 'string' ? Buffer.from(chunk) : chunk;
+      const lines = [];
+      let start = 0;
+      let newline = buf.indexOf(10, start);
+      while (newline !== -1) {
+        if (pending.length > 0) {
+          pending.push(buf.subarray(start, newline));
+          decode(Buffer.concat(pending), lines);
+          pending = [];
+        } else {
+          decode(buf.subarray(start, newline), lines);
+        }
+        start = newline + 1;
+        newline = buf.indexOf(10, start);
+      }
+      if (start < buf.length) {
+        pending.push(buf.subarray(start));
+      }
+      return lines;
+    },
+
+    flush() {
+      const lines = [];
+      if (pending.length > 0) {
+        decode(Buffer.concat(pending), lines);
+      }
+      pending = [];
+      return lines.length > 0 ? lines[0] : '';
+    }
+  };
+}
+
 /**
  * Emit SSE event for progress updates and tool execution
  * Helper function to emit SSE events with explicit flushing
@@ -67,11 +199,20 @@ function emitSSE(responseStream, eventType, data) {
   if (!responseStream) return;
   
   try {
-    const dataStr = typeof data === 'string' ? data : JSON.stringify(data);
     // Only log non-content events to reduce noise
     if (eventType !== 'final_response' && eventType !== 'content') {
-      console.log('[SSE] Emitting event:', eventType, 'with data:', dataStr.substring(0, 100) + (dataStr.length > 100 ? '...' : ''));
+      const logStr = typeof data === 'string' ? data : JSON.stringify(data);
+      console.log('[SSE] Emitting event:', eventType, 'with data:', logStr.substring(0, 100) + (logStr.length > 100 ? '...' : ''));
     }
+
+    // In-process consumers (the agent job queue) take the event object as-is,
+    // skipping a stringify + re-parse round trip for every streamed token
+    if (typeof responseStream.emitEvent === 'function' && typeof data !== 'string') {
+      responseStream.emitEvent(eventType, data);
+      return;
+    }
+
+    const dataStr = typeof data === 'string' ? data : JSON.stringify(data);
     responseStream.write(`event: ${eventType}\ndata: ${dataStr}\n\n`);
     
     // Explicitly flush to prevent buffering (critical for pm2 and SSE)
@@ -86,7 +227,10 @@ function emitSSE(responseStream, eventType, data) {
 module.exports = {
   writeSseEvent,
   sendSseError,
+  createTokenWriter,
   startKeepAlive,
   stopKeepAlive,
+  escapeSseNewlines,
+  createLineSplitter,
   emitSSE
 }; 
\ No newline at end of file
@@ -0,0 +1,46 @@
+// services/startupState.js
+
+/**
+ * Tracks the background warm-up of startup components (MongoDB pool, MCP
+ * tool discovery) so the HTTP server can bind before they finish.
+ * A component is 'warming' until it is marked 'ready' or 'failed'; a failed
+ * component counts as settled since the service continues without it.
+ */
+const components = {};
+
+function registerComponent(name) {
+  components[name] = { status: 'warming', since: new Date().toISOString() };
+}
+
+function markReady(name) {
+  components[name] = { status: 'ready', since: new Date().toISOString() };
+}
+
+function markFailed(name, error) {
+  components[name] = {
+    status: 'failed',
+    since: new Date().toISOString(),
+    error: error?.message || String(error)
+  };
+}
+
+function isSettled(name) {
+  return components[name]?.status !== 'warming';
+}
+
+function isWarm() {
+  return Object.keys(components).every(isSettled);
+}
+
+function getStartupState() {
+  return { ...components };
+}
+
+module.exports = {
+  registerComponent,
+  markReady,
+  markFailed,
+  isSettled,
+  isWarm,
+  getStartupState
+};
@@ -10,7 +10,7 @@ const {
 const { prepareCopilotContext } = require('./contextBuilder');
 const { runModel, runModelStream } = require('./queries/modelQueries');
 const { createMessage } = require('./messageUtils');
-const { sendSseError, startKeepAlive, stopKeepAlive } = require('./sseUtils');
+const { sendSseError, createTokenWriter, startKeepAlive, stopKeepAlive } = require('./sseUtils');
 const streamStore = require('./streamStore');
 
 /**
@@ -89,6 +89,8 @@ async function setupCopilotStream(opts) {
  * Now accepts prepared setup data instead of doing the setup itself.
  */
 async function handleCopilotStreamRequest(streamData, res) {
+  // Created up front so the error path can flush queued tokens too
+  const tokenWriter = createTokenWriter(res);
   try {
     // Handle case where streamData might be a Promise (defensive programming)
     if (streamData && typeof streamData.then === 'function') {
@@ -125,14 +127,13 @@ async function handleCopilotStreamRequest(streamData, res) {
     let assistantBuffer = '';
     const onChunk = (text) => {
       assistantBuffer += text;
-      const safeText = text.replace(/\n/g, '\\n');
-      res.write(`data: ${safeText}\n\n`);
-      if (typeof res.flush === 'function') res.flush();
+      tokenWriter.write(text);
     };
 
     await runModelStream(ctx, modelData, onChunk);
 
     // Stream completed
+    tokenWriter.flush();
     res.write('data: [DONE]\n\n');
     if (typeof res.flush === 'function') res.flush();
     res.end();
@@ -156,6 +157,7 @@ async function handleCopilotStreamRequest(streamData, res) {
     }
   } catch (error) {
     console.error('Streaming copilot error:', error);
+    tokenWriter.flush();
     sendSseError(res, 'Internal server error');
   }
 }
@@ -1,11 +1,25 @@
 from flask import Flask, request, jsonify
-import os, sys, json, logging
-from tokenizer import count_tokens
+from flask.json.provider import DefaultJSONProvider
+import os, sys, json, logging, time
+from tokenizer import count_tokens, preload_encoding
 from text_utils import create_query_from_messages
 from state_utils import get_path_state
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Parse request bodies with orjson; responses still use the default encoder."""
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 
 file_path = os.path.dirname(os.path.realpath(__file__))
 
@@ -112,6 +126,15 @@ def log_startup():
     startup_logger.info(f"Working directory: {file_path}")
     startup_logger.info(f"Python: {sys.version}")
 
+    # Warm the tokenizer so the first /count_tokens or /get_prompt_query
+    # request doesn't block on loading the encoding file
+    start = time.monotonic()
+    try:
+        preload_encoding()
+        startup_logger.info(f"Tokenizer encoding loaded in {time.monotonic() - start:.2f}s")
+    except Exception as e:
+        startup_logger.warning(f"Tokenizer preload failed, will load on first request: {e}")
+
     # Log registered routes
     routes = []
     for rule in app.url_map.iter_rules():
@@ -1 +1 @@
-from .tokenizer import count_tokens
+from .tokenizer import count_tokens, preload_encoding
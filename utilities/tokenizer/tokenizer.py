@@ -1,8 +1,17 @@
 import tiktoken
 
+# Use the cl100k_base encoding (used by GPT-4-turbo and GPT-3.5-turbo)
+ENCODING_NAME = "cl100k_base"
+
+def preload_encoding():
+    """
+    Load the BPE ranks for ENCODING_NAME into tiktoken's cache so the first
+    request does not pay for reading (or downloading) the encoding file.
+    """
+    return tiktoken.get_encoding(ENCODING_NAME)
+
 def count_tokens(text_list):
-    # Use the cl100k_base encoding (used by GPT-4-turbo and GPT-3.5-turbo)
-    encoding = tiktoken.get_encoding("cl100k_base")
+    encoding = tiktoken.get_encoding(ENCODING_NAME)
     
     # Initialize list to store token counts
     token_counts = []